@@ -1,6 +1,8 @@
 import uuid
+import orjson
 from dash import Dash, html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
+from flask.json.provider import DefaultJSONProvider
 
 from layout.header import cbe_header
 from layout.tabs import tabs
@@ -22,8 +24,20 @@ app = Dash(
 )
 
 
+# Dash already encodes responses with orjson (via plotly) when it is installed;
+# use it for decoding the callback request bodies (incl. store State) as well.
+class ORJSONProvider(DefaultJSONProvider):
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.server.json = ORJSONProvider(app.server)
+
+
 # Initialize Equipment Library at startup
-equipment_library = load_library("data/input/equipment_data.JSON").model_dump()
+equipment_library = load_library("data/input/equipment_data.JSON").model_dump(
+    mode="json", exclude_defaults=True
+)
 
 
 def serve_layout():
@@ -4,8 +4,6 @@ from dash_iconify import DashIconify
 import pandas as pd
 import json
 
-from sqlalchemy import null
-
 from utils.units import unit_map
 
 with open("data/input/metadata_index.json", "r") as f:
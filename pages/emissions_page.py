@@ -2,12 +2,14 @@ import dash
 from dash import dcc, html, Input, Output, State, callback, ctx
 import dash_bootstrap_components as dbc
 
+import hashlib
+import orjson
 import pandas as pd
 from pathlib import Path
 
 from dash_iconify import DashIconify
 
-from src.config import URLS
+from src.config import URLS, Columns as Col
 
 from utils.units import unit_map
 
@@ -184,7 +186,7 @@ def update_metadata(
     if trigger in ["update-scen-A", "update-scen-B", "update-scen-C"]:
         metadata.add_emission_scenario(scenario, overwrite=True)
 
-    return metadata.model_dump()
+    return metadata.model_dump(mode="json", exclude_defaults=True)
 
 
 @callback(
@@ -216,8 +218,10 @@ def update_static_emission_fields(unit_mode, ref_value):
     unit = conversion["label"]
     gas_emission_factor_placeholder = conversion["default_value"]
 
-    # Convert existing user inputs to SI if they exist
-    gas_value_si = conversion["func"](ref_value) if ref_value is not None else None
+    # Convert existing user inputs to SI if they exist, otherwise leave the field untouched
+    gas_value_si = (
+        conversion["func"](ref_value) if ref_value is not None else dash.no_update
+    )
 
     return unit, gas_emission_factor_placeholder, gas_value_si
 
@@ -231,6 +235,40 @@ def store_active_emissions_tab(active_tab):
     return active_tab
 
 
+def _inputs_digest(metadata_json, equipment_json):
+    # Hash of everything the calculation depends on, used to skip recalculating
+    # when "Calculate" is clicked again without changing any input
+    payload = orjson.dumps([metadata_json, equipment_json], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _is_up_to_date(folder, filename, digest):
+    # inputs.digest is written once source energy has been saved, so a match
+    # means both energy files were computed from these exact inputs
+    digest_path = folder / "inputs.digest"
+    return (
+        (folder / filename).exists()
+        and digest_path.exists()
+        and digest_path.read_text() == digest
+    )
+
+
+def _toast():
+    return dbc.Toast(
+        "Calculation finished!",
+        duration=3000,
+        is_open=True,
+        style={
+            "position": "fixed",
+            "top": 66,
+            "right": 50,
+            "width": 250,
+            "zIndex": 9999,
+        },
+        header=[DashIconify(icon="ei:check", width=20), "Success"],
+    )
+
+
 @callback(
     Output("site-energy-store", "data"),
     Input("button-calculate", "n_clicks"),
@@ -246,6 +284,16 @@ def run_loads_to_site(n_clicks, metadata_json, equipment_json, session_data):
     folder = Path(f"/tmp/{session_data['session_id']}")  # isolated, ephemeral
     folder.mkdir(parents=True, exist_ok=True)
 
+    site_path = folder / "site_energy.feather"
+    digest = _inputs_digest(metadata_json, equipment_json)
+
+    if _is_up_to_date(folder, site_path.name, digest):
+        print(f"Inputs unchanged, reusing Site Energy at: {site_path}")
+        return str(site_path)
+
+    # the energy files are about to change, invalidate until source is saved
+    (folder / "inputs.digest").unlink(missing_ok=True)
+
     metadata = Metadata(**metadata_json)
     equipment = EquipmentLibrary(**equipment_json)
 
@@ -254,8 +302,7 @@ def run_loads_to_site(n_clicks, metadata_json, equipment_json, session_data):
         load_data, equipment, metadata.equipment_scenarios, detail=True
     )
 
-    site_path = folder / "site_energy.pkl"
-    site_energy.to_pickle(site_path)
+    site_energy.reset_index().to_feather(site_path)
     print(f"Saving Site Energy for to: {site_path}")
 
     return str(site_path)
@@ -266,10 +313,11 @@ def run_loads_to_site(n_clicks, metadata_json, equipment_json, session_data):
     Output("calc-status-toast", "children"),
     Input("site-energy-store", "data"),
     State("metadata-store", "data"),
+    State("equipment-store", "data"),
     State("session-store", "data"),
     prevent_initial_call=True,
 )
-def run_site_to_source(site_energy_path, metadata_json, session_data):
+def run_site_to_source(site_energy_path, metadata_json, equipment_json, session_data):
 
     if not site_energy_path:
         raise dash.exceptions.PreventUpdate
@@ -277,27 +325,27 @@ def run_site_to_source(site_energy_path, metadata_json, session_data):
     folder = Path(f"/tmp/{session_data['session_id']}")  # isolated, ephemeral
     folder.mkdir(parents=True, exist_ok=True)
 
-    site_energy = pd.read_pickle(site_energy_path)
+    source_path = folder / "source_energy.feather"
+    digest = _inputs_digest(metadata_json, equipment_json)
+
+    if _is_up_to_date(folder, source_path.name, digest):
+        print(f"Inputs unchanged, reusing Source Energy at: {source_path}")
+        return dcc.Store(id="source-energy-store", data=str(source_path)), _toast()
+
+    site_energy = pd.read_feather(site_energy_path).set_index(Col.TIMESTAMP.value)
     metadata = Metadata(**metadata_json)
 
     source_energy = site_to_source(site_energy, metadata=metadata)
 
-    source_path = folder / "source_energy.pkl"
-    source_energy.to_pickle(source_path)
-    print(f"Saving Source Energy for to: {source_path}")
+    # store scenario ids as categoricals (in order of appearance) so the results
+    # callbacks filter on integer codes and can list scenarios without a scan
+    for col in (Col.EQ_SCEN_ID.value, Col.EM_SCEN_ID.value):
+        source_energy[col] = pd.Categorical(
+            source_energy[col], categories=source_energy[col].unique()
+        )
 
-    toast = dbc.Toast(
-        "Calculation finished!",
-        duration=3000,
-        is_open=True,
-        style={
-            "position": "fixed",
-            "top": 66,
-            "right": 50,
-            "width": 250,
-            "zIndex": 9999,
-        },
-        header=[DashIconify(icon="ei:check", width=20), "Success"],
-    )
+    source_energy.reset_index().to_feather(source_path)
+    (folder / "inputs.digest").write_text(digest)
+    print(f"Saving Source Energy for to: {source_path}")
 
-    return dcc.Store(id="source-energy-store", data=str(source_path)), toast
+    return dcc.Store(id="source-energy-store", data=str(source_path)), _toast()
@@ -214,7 +214,7 @@ def save_scenario(
 
     equipment_data.add_equipment_scenario(scenario, overwrite=True)
 
-    return equipment_data.model_dump()
+    return equipment_data.model_dump(mode="json", exclude_defaults=True)
 
 
 @callback(
@@ -1,24 +1,24 @@
-from pprint import pprint
 import dash
 from dash import dcc, html, Input, Output, State, callback, ctx, no_update
 import dash_bootstrap_components as dbc
 import base64
+import hashlib
 import io
-import json
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 from dash_iconify import DashIconify
 import pandas as pd
+import pyarrow.parquet as pq
 
 from src.config import URLS
 from src.metadata import Metadata
-from src.loads import StandardLoad, STANDARD_COLUMNS
-
+from src.loads import StandardLoad
+from utils.inputs import load_locations
 
 
 from layout.input import (
-    select_gea_grid_region,
     select_location,
     select_load_data,
     modal_load_simulation_data,
@@ -29,16 +29,25 @@ from layout.output import summary_loads_selection
 
 dash.register_page(__name__, name="Loads", path=URLS.HOME.value, order=0)
 
-# Preprocess once at the top of the file
-locations_df = pd.read_csv("data/input/locations.csv")
 
-# Split space-separated zips into rows
-locations_df = (
-    locations_df.assign(zip=locations_df["zips"].str.split())
-    .explode("zip")
-    .drop(columns=["zips"])
-)
-locations_df["zip"] = locations_df["zip"].astype(str)
+@lru_cache(maxsize=1)
+def _location_data():
+    """Load the locations on first use (page render or callback), not at import.
+
+    Only the zip lookup and the location dropdown are kept, so the dataframe
+    is released once both are built and the dropdown options are not rebuilt
+    on every render.
+    """
+    locations_df = load_locations()  # cached as Parquet, see load_locations
+
+    # zip -> location row; a zip can belong to several cities, keep the first one
+    zip_to_row = (
+        locations_df.drop_duplicates("zip")
+        .set_index("zip")[["city", "ASHRAE", "gea_grid_region"]]
+        .to_dict("index")
+    )
+
+    return zip_to_row, select_location(locations_df=locations_df)
 
 
 def layout():
@@ -51,7 +60,7 @@ def layout():
                         [
                             html.H5("Loads"),
                             html.Hr(),
-                            select_location(locations_df=locations_df),
+                            _location_data()[1],
                             html.Hr(),
                             select_load_data(),
                             modal_load_simulation_data(),
@@ -140,6 +149,32 @@ def toggle_modal(open_clicks, close_clicks, is_open):
     return is_open
 
 
+def _set_location(metadata, selected_zip):
+    # look up the location row
+    zip_to_row, _ = _location_data()
+    row = zip_to_row[selected_zip]
+    metadata["location"] = row["city"]
+    metadata["ashrae_climate_zone"] = row["ASHRAE"]
+    for scen in metadata["emission_settings"]:
+        scen["gea_grid_region"] = row["gea_grid_region"]
+
+
+def _set_building_type(metadata, selected_building_type):
+    metadata["building_type"] = selected_building_type
+
+
+def _set_vintage(metadata, selected_vintage):
+    metadata["vintage"] = int(selected_vintage)
+
+
+# input id -> function applying its value to the metadata dict
+METADATA_INPUT_HANDLERS = {
+    "location-input": _set_location,
+    "building-type-input": _set_building_type,
+    "vintage-input": _set_vintage,
+}
+
+
 @callback(
     Output("metadata-store", "data"),
     Input("location-input", "value"),
@@ -154,28 +189,39 @@ def update_metadata(
     selected_vintage,
     metadata_data,
 ):
-    # Figure out which input triggered
-    trigger = ctx.triggered_id
-
-    if not trigger:  # no trigger
-        return metadata_data
-
-    metadata = Metadata(**metadata_data) if metadata_data else Metadata.create()
-
-    if trigger == "location-input" and selected_zip:
-        # look up the location row
-        row = locations_df.loc[locations_df["zip"] == selected_zip].iloc[0]
-        metadata.location = row["city"]
-        metadata.ashrae_climate_zone = row["ASHRAE"]
-        metadata.set_gea_grid_region_for_all(row["gea_grid_region"])
+    # Dash batches inputs that changed together into one call, so collect the
+    # handler for every triggered input and skip empty values
+    updates = []
+    for trigger in ctx.triggered:
+        handler = METADATA_INPUT_HANDLERS.get(trigger["prop_id"].split(".")[0])
+        if handler and trigger["value"]:
+            updates.append((handler, trigger["value"]))
+
+    if not updates:
+        return no_update
+
+    # The store was validated when it was written and the values come from
+    # fixed option lists, so update the dict without rebuilding Metadata
+    metadata = metadata_data or Metadata.create().model_dump(
+        mode="json", exclude_defaults=True
+    )
+    for handler, value in updates:
+        handler(metadata, value)
 
-    elif trigger == "building-type-input" and selected_building_type:
-        metadata.building_type = selected_building_type
+    return metadata
 
-    elif trigger == "vintage-input" and selected_vintage:
-        metadata.vintage = selected_vintage
 
-    return metadata.model_dump()
+@lru_cache(maxsize=64)
+def _cached_loads_summary(location, building_type, vintage, ashrae_climate_zone):
+    # summary_loads_selection only shows these fields, so they are the cache key
+    return summary_loads_selection(
+        {
+            "location": location,
+            "building_type": building_type,
+            "vintage": vintage,
+            "ashrae_climate_zone": ashrae_climate_zone,
+        }
+    )
 
 
 @callback(Output("summary-selection-info", "children"), Input("metadata-store", "data"))
@@ -183,38 +229,61 @@ def show_metadata(data):
     if not data:
         return "No metadata yet"
 
-    return summary_loads_selection(data)
+    return _cached_loads_summary(
+        data.get("location"),
+        data.get("building_type"),
+        data.get("vintage"),
+        data.get("ashrae_climate_zone"),
+    )
 
 
 def parse_custom_load_data(contents, filename):
     """Parse and validate uploaded CSV file contents."""
     content_type, content_string = contents.split(",")
     decoded = base64.b64decode(content_string)
-    
+
+    # Name the output after the file contents, so re-uploading the same file
+    # reuses the already validated parquet instead of parsing it again
+    temp_dir = Path("data/output/custom")
+    digest = hashlib.blake2b(decoded, digest_size=16).hexdigest()
+    temp_file = temp_dir / f"custom_load_{digest}.parquet"
+
     try:
+        if temp_file.exists():
+            n_rows = pq.read_metadata(temp_file).num_rows
+            return {
+                "status": "success",
+                "message": f"Successfully loaded {n_rows} rows of custom load data "
+                f"from {filename}",
+                "filepath": str(temp_file),
+            }
+
         # Read CSV into DataFrame
-        df = pd.read_csv(io.StringIO(decoded.decode("utf-8")))
-        
-        # Check for required columns (using template names)
-        missing_cols = [col for col in STANDARD_COLUMNS if col not in df.columns]
-        if missing_cols:
-            raise ValueError(f"Missing required columns: {missing_cols}")
-                    
-        # Create StandardLoad object (this runs validation)
+        df = pd.read_csv(io.BytesIO(decoded), engine="pyarrow")
+
+        # Create StandardLoad object (this runs validation, incl. required columns)
         load_data = StandardLoad(df)
-        
-        # Save to temporary file
-        temp_dir = Path("data/output/custom")
+
+        # Save to a per-upload temporary file, renamed into place once complete
+        # (unique, so concurrent uploads of the same file don't collide)
         temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_file = temp_dir / f"custom_load_{Path(filename).stem}.parquet"
-        load_data.to_parquet(temp_file)
-        
+        with tempfile.NamedTemporaryFile(
+            dir=temp_dir, prefix=temp_file.stem, suffix=".tmp", delete=False
+        ) as f:
+            partial_file = Path(f.name)
+        try:
+            load_data.to_parquet(partial_file)
+            partial_file.replace(temp_file)
+        finally:
+            partial_file.unlink(missing_ok=True)
+
         return {
             "status": "success",
-            "message": f"Successfully loaded {len(df)} rows of custom load data",
+            "message": f"Successfully loaded {len(df)} rows of custom load data "
+            f"from {filename}",
             "filepath": str(temp_file),
         }
-        
+
     except Exception as e:
         return {
             "status": "error",
@@ -255,7 +324,7 @@ def process_upload(contents, filename, metadata_data):
         metadata.load_type = "load_custom"
         metadata.custom_load_path = result["filepath"]
         
-        return alert, metadata.model_dump()
+        return alert, metadata.model_dump(mode="json", exclude_defaults=True)
     else:
         alert = dbc.Alert(
             [
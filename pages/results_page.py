@@ -2,14 +2,15 @@ import dash
 from dash import html, dcc, Input, Output, State, callback
 import dash_bootstrap_components as dbc
 
+from collections import OrderedDict
 import datetime
+from functools import lru_cache
+import threading
 import pandas as pd
 import plotly.express as px
 from pathlib import Path
 
-from io import StringIO
-
-from src.config import URLS
+from src.config import URLS, Columns as Col
 
 from layout.output import summary_project_info, summary_scenario_results
 
@@ -26,64 +27,134 @@ from src.visuals import (
 
 dash.register_page(__name__, name="Results", path=URLS.RESULTS.value, order=3)
 
+# Placeholder shown until a calculation has been run, built once and reused
+EMPTY_FIG = px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
+
+
+# The results page is static (charts are filled in by callbacks), so the
+# component tree is built once at import instead of on every navigation
+layout = dbc.Container(
+    children=[
+        dbc.Row(
+            [
+                dbc.Col(
+                    [
+                        html.Div(id="building-info-results"),
+                        html.Hr(),
+                        summary_scenario_results(),
+                        html.Hr(),
+                        dbc.Button(
+                            "Download Results",
+                            color="primary",
+                            id="download-button",
+                            n_clicks=0,
+                            active=False,
+                        ),
+                    ],
+                    width=3,
+                ),
+                dbc.Col(
+                    [
+                        # results_utility_bar(),
+                        chart_tabs(),
+                        html.Hr(),
+                    ],
+                    width=9,
+                ),
+            ]
+        ),
+        dcc.Download(id="download-data"),
+    ],
+    fluid=True,
+)
 
-def layout():
-    return dbc.Container(
-        children=[
-            dbc.Row(
-                [
-                    dbc.Col(
-                        [
-                            html.Div(id="building-info-results"),
-                            html.Hr(),
-                            summary_scenario_results(),
-                            html.Hr(),
-                            dbc.Button(
-                                "Download Results",
-                                color="primary",
-                                id="download-button",
-                                n_clicks=0,
-                                active=False,
-                            ),
-                        ],
-                        width=3,
-                    ),
-                    dbc.Col(
-                        [
-                            # results_utility_bar(),
-                            chart_tabs(),
-                            html.Hr(),
-                        ],
-                        width=9,
-                    ),
-                ]
-            ),
-            dcc.Download(id="download-data"),
-        ],
-        fluid=True,
-    )
 
+# newest source energy frame per session file, most recently used last
+_SOURCE_ENERGY_CACHE: "OrderedDict[str, tuple[int, pd.DataFrame]]" = OrderedDict()
+_SOURCE_ENERGY_CACHE_SIZE = 2
+_SOURCE_ENERGY_CACHE_LOCK = threading.Lock()
 
-def load_source_energy(session_data):
-    """Load the source energy dataframe for this user session."""
 
+def _read_source_energy(filepath: str) -> pd.DataFrame:
+    """Read a session's source energy file, reusing the last read if unchanged.
+
+    Only the newest version of each file is kept (a rewritten file replaces
+    its entry) and at most two files are cached, so a worker holds at most
+    two source frames (~50 MB each for a full-year, multi-scenario run).
+    """
+    mtime_ns = Path(filepath).stat().st_mtime_ns
+
+    with _SOURCE_ENERGY_CACHE_LOCK:
+        cached = _SOURCE_ENERGY_CACHE.get(filepath)
+        if cached is not None and cached[0] == mtime_ns:
+            _SOURCE_ENERGY_CACHE.move_to_end(filepath)
+            return cached[1]
+
+    df = pd.read_feather(filepath).set_index(Col.TIMESTAMP.value)
+
+    with _SOURCE_ENERGY_CACHE_LOCK:
+        _SOURCE_ENERGY_CACHE[filepath] = (mtime_ns, df)
+        _SOURCE_ENERGY_CACHE.move_to_end(filepath)
+        while len(_SOURCE_ENERGY_CACHE) > _SOURCE_ENERGY_CACHE_SIZE:
+            _SOURCE_ENERGY_CACHE.popitem(last=False)
+
+    return df
+
+
+def _source_energy_path(session_data):
     if not session_data or "session_id" not in session_data:
         return None
 
-    session_id = session_data["session_id"]
-    folder = Path(f"/tmp/{session_data['session_id']}")
-    filepath = folder / "source_energy.pkl"
+    return Path(f"/tmp/{session_data['session_id']}") / "source_energy.feather"
+
 
-    if not filepath.exists():
+def load_source_energy(session_data):
+    """Load the source energy dataframe for this user session.
+
+    The newest version of each session file is cached, so the chart
+    callbacks firing on one interaction share a single read. The returned
+    dataframe is shared between callbacks and must not be modified in place.
+    """
+
+    filepath = _source_energy_path(session_data)
+
+    if filepath is None or not filepath.exists():
         return None
 
+    session_id = session_data["session_id"]
+
     try:
-        return pd.read_pickle(filepath)
+        return _read_source_energy(str(filepath))
     except Exception as e:
-        print(f"[ERROR] Failed to load source_energy.pkl for session {session_id}: {e}")
+        print(f"[ERROR] Failed to load {filepath.name} for session {session_id}: {e}")
         return None
 
 
+@lru_cache(maxsize=8)
+def _cached_figure(plot_func, filepath: str, mtime_ns: int, *args, **kwargs):
+    # mtime_ns is only part of the cache key, so a rewritten file is re-plotted
+    return plot_func(_read_source_energy(filepath), *args, **kwargs)
+
+
+def plot_source_energy(plot_func, session_data, *args, **kwargs):
+    """Build a results figure from the session's source energy.
+
+    Figures are memoized per source file version and plot arguments, so
+    returning to a scenario/unit combination does not rebuild it. At most
+    eight figures are kept per worker (the four charts for two scenario/unit
+    selections, a few MB each for full-year hourly traces). Arguments must be
+    hashable (pass tuples instead of lists).
+    """
+
+    if load_source_energy(session_data) is None:
+        return EMPTY_FIG
+
+    filepath = _source_energy_path(session_data)
+    return _cached_figure(
+        plot_func, str(filepath), filepath.stat().st_mtime_ns, *args, **kwargs
+    )
+
+
 @callback(
     Output("building-info-results", "children"),
     Input("metadata-store", "data"),
@@ -116,17 +187,16 @@ def update_meter_plot(
     unit_mode,
 ):
 
-    df = load_source_energy(session_data)
-    if df is None:
-        return px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
-
     # flags from toggles
     stacked = "stacked" in stacked_value
     include_gas = "gas" in gas_value
     frequency_value = frequency_value if frequency_value else "D"
 
-    fig = plot_meter_timeseries(
-        df,
+    # the resampled figure is memoized per frequency, so switching back to a
+    # previously viewed aggregation does not resample the year again
+    fig = plot_source_energy(
+        plot_meter_timeseries,
+        session_data,
         equipment_scenarios,
         emission_scenarios,
         stacked=stacked,
@@ -147,15 +217,19 @@ def update_meter_plot(
 def update_total_emissions_plot(
     session_data, equipment_scenarios, emission_scenario, unit_mode
 ):
-    df = load_source_energy(session_data)
-    if df is None:
-        return px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
+    # a cleared dropdown gives None, nothing to plot (and no cache key)
+    if not equipment_scenarios or not emission_scenario:
+        return EMPTY_FIG
 
     if isinstance(emission_scenario, str):
         emission_scenario = [emission_scenario]
 
-    fig = plot_energy_and_emissions(
-        df, equipment_scenarios, emission_scenario, unit_mode=unit_mode
+    fig = plot_source_energy(
+        plot_energy_and_emissions,
+        session_data,
+        tuple(equipment_scenarios),
+        tuple(emission_scenario),
+        unit_mode=unit_mode,
     )
     return fig
 
@@ -170,17 +244,21 @@ def update_total_emissions_plot(
 def update_emissions_bar_plot(session_data, emission_scenarios, unit_mode):
 
     df = load_source_energy(session_data)
-    if df is None:
-        return px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
+    if df is None or not emission_scenarios:
+        return EMPTY_FIG
 
-    equipment_scenarios = df["eq_scen_id"].unique().tolist()
+    equipment_scenarios = df["eq_scen_id"].cat.categories.tolist()
 
     # Ensure emission_scenarios is a list
     if isinstance(emission_scenarios, str):
         emission_scenarios = [emission_scenarios]
 
-    fig = plot_emission_scenarios_grouped(
-        df, equipment_scenarios, emission_scenarios, unit_mode=unit_mode
+    fig = plot_source_energy(
+        plot_emission_scenarios_grouped,
+        session_data,
+        tuple(equipment_scenarios),
+        tuple(emission_scenarios),
+        unit_mode=unit_mode,
     )
     return fig
 
@@ -197,12 +275,9 @@ def update_emissions_bar_plot(session_data, emission_scenarios, unit_mode):
 def update_emissions_heatmap(
     session_data, equipment_scenario, emission_scenario, emission_type, unit_mode
 ):
-    df = load_source_energy(session_data)
-    if df is None:
-        return px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
-
-    fig = plot_emissions_heatmap(
-        df,
+    fig = plot_source_energy(
+        plot_emissions_heatmap,
+        session_data,
         equipment_scenario,
         emission_scenario,
         unit_mode=unit_mode,
@@ -231,7 +306,7 @@ def update_scatter_plot(
 ):
     df = load_source_energy(session_data)
     if df is None:
-        return px.line(x=[0, 1], y=[0, 0], title="Waiting for data...")
+        return EMPTY_FIG
 
     frequency_value = frequency_value if frequency_value else "D"
 
@@ -1,5 +1,5 @@
-from pprint import pprint
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -45,17 +45,30 @@ class StandardEmissions:
         if missing:
             raise ValueError(f"Missing required columns in emissions data: {missing}")
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce", utc=False)
+        # Parquet sources are already typed; only convert when needed
+        if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+            df["timestamp"] = pd.to_datetime(
+                df["timestamp"], errors="coerce", utc=False
+            )
         if df["timestamp"].isnull().any():
             raise ValueError("Invalid or missing timestamps in emissions data")
 
-        df = df.sort_values("timestamp").set_index("timestamp")
+        # filtered Parquet rows are usually already in order; only sort if not
+        if not df["timestamp"].is_monotonic_increasing:
+            df = df.sort_values("timestamp")
+        df = df.set_index("timestamp")
 
-        # enforce numeric
-        for col in ["lrmer_co2e_c", "lrmer_co2e_p", "srmer_co2e_c", "srmer_co2e_p"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-            if df[col].isnull().any():
-                raise ValueError(f"Invalid numeric values in column {col}")
+        # enforce numeric (convert only non-numeric columns, then one NaN check)
+        numeric_cols = ["lrmer_co2e_c", "lrmer_co2e_p", "srmer_co2e_c", "srmer_co2e_p"]
+        to_convert = [
+            c for c in numeric_cols if not pd.api.types.is_numeric_dtype(df[c])
+        ]
+        if to_convert:
+            df[to_convert] = df[to_convert].apply(pd.to_numeric, errors="coerce")
+
+        invalid = df[numeric_cols].isna().any()
+        if invalid.any():
+            raise ValueError(f"Invalid numeric values in column {invalid.idxmax()}")
 
         return df
 
@@ -74,6 +87,41 @@ class StandardEmissions:
         return self.df.describe()
 
 
+@lru_cache(maxsize=64)
+def _read_emissions(
+    path: Union[str, Path], grid_scenario: str, gea_grid_region: str, year: int
+) -> pd.DataFrame:
+    """
+    Read the emission factors for one grid scenario / region / year.
+    Cached, so emission scenarios sharing a grid selection (and repeated
+    calculations) do not re-read the Parquet file. The returned frame is
+    shared and must not be modified.
+    """
+
+    # --- Filter by scenario, region, and years ---
+    # filters/columns are pushed down to pyarrow, so only the matching rows of
+    # the columns used below are materialized
+    return pd.read_parquet(
+        path,
+        engine="pyarrow",
+        columns=[
+            "year",
+            "timestamp",
+            "lrmer_co2e_c",
+            "lrmer_co2e_p",
+            "lrmer_co2e",
+            "srmer_co2e_c",
+            "srmer_co2e_p",
+            "srmer_co2e",
+        ],
+        filters=[
+            ("emission_scenario", "==", grid_scenario),
+            ("gea_grid_region", "==", gea_grid_region),
+            ("year", "==", year),
+        ],
+    )
+
+
 def get_emissions_data(
     scenario: EmissionScenario,
     path: Union[str, Path] = "data/input/emission_data.parquet",
@@ -83,14 +131,9 @@ def get_emissions_data(
     Handles selection of 'Combustion only' vs. 'Includes pre-combustion'.
     """
 
-    df = pd.read_parquet(path, engine="pyarrow")
-
-    # --- Filter by scenario, region, and years ---
-    df = df[
-        (df["emission_scenario"] == scenario.grid_scenario)
-        & (df["gea_grid_region"] == scenario.gea_grid_region)
-        & (df["year"] == scenario.year)
-    ].copy()
+    df = _read_emissions(
+        path, scenario.grid_scenario, scenario.gea_grid_region, scenario.year
+    )
 
     if df.empty:
         raise ValueError(
@@ -112,22 +155,14 @@ def get_emissions_data(
     #     )
 
     # --- Build canonical schema ---
-    result = pd.DataFrame(
-        {
-            "em_scen_id": scenario.em_scen_id,
-            "emission_scenario": scenario.grid_scenario,
-            "gea_grid_region": scenario.gea_grid_region,
-            "time_zone": scenario.time_zone,
-            "emission_type": scenario.emission_type,
-            "year": df["year"],
-            "timestamp": df["timestamp"],
-            "lrmer_co2e_c": df["lrmer_co2e_c"],
-            "lrmer_co2e_p": df["lrmer_co2e_p"],
-            "lrmer_co2e": df["lrmer_co2e"],
-            "srmer_co2e_c": df["srmer_co2e_c"],
-            "srmer_co2e_p": df["srmer_co2e_p"],
-            "srmer_co2e": df["srmer_co2e"],
-        }
+    # the cached read already holds the year/timestamp/rate columns; assign
+    # returns a new frame (the cache stays untouched) with the scenario fields
+    result = df.assign(
+        em_scen_id=scenario.em_scen_id,
+        emission_scenario=scenario.grid_scenario,
+        gea_grid_region=scenario.gea_grid_region,
+        time_zone=scenario.time_zone,
+        emission_type=scenario.emission_type,
     )
 
     return StandardEmissions(result)
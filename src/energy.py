@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from typing import Optional, Union
@@ -8,7 +10,7 @@ from src.emissions import StandardEmissions, get_emissions_data, EmissionScenari
 from src.metadata import Metadata
 from src.config import Columns as Col
 
-from utils.units import cop_h_to_cop_c
+from utils.units import cop_h_to_cop_c, Wh_x_g_per_kWh_to_kg
 from utils.interp import interp_vector
 
 
@@ -121,28 +123,42 @@ def loads_to_site_energy(
     if isinstance(scenario_ids, str):
         scenario_ids = [scenario_ids]
 
+    # ---- pull inputs (shared by all scenarios, never modified) ----
+    index = load.df.index  # timestamp
+    temps = load.df[Col.T_OUT_C.value].to_numpy()
+    heating_W = load.df[Col.HEATING_W.value].to_numpy()
+    cooling_W = load.df[Col.COOLING_W.value].to_numpy()
+    n = len(index)
+
     results = []
 
     for scenario_id in scenario_ids:
 
-        # ---- pull inputs ----
-        df = load.df.copy()  # index = timestamp
-        temps = df[Col.T_OUT_C.value].to_numpy()
-
-        df[Col.HHW_W.value] = df[Col.HEATING_W.value]
-        df[Col.CHW_W.value] = df[Col.COOLING_W.value]
+        # hourly columns are kept as plain arrays and only assembled into a
+        # DataFrame once all phases have run
+        out = {
+            Col.T_OUT_C.value: temps,
+            Col.HEATING_W.value: heating_W,
+            Col.COOLING_W.value: cooling_W,
+            Col.HHW_W.value: heating_W,
+            Col.CHW_W.value: cooling_W,
+        }
 
         # Remainders in W_th
-        df[Col.HHW_REM_W.value] = df[Col.HHW_W.value].copy()
-        df[Col.CHW_REM_W.value] = df[Col.CHW_W.value].copy()
-
-        # Outputs
-        df[Col.ELEC_WH.value] = 0.0
-        df[Col.GAS_WH.value] = 0.0
-
-        # detail columns (create lazily; safer to pre-create as NaN for clarity)
+        hhw_rem = heating_W.astype(float)
+        chw_rem = cooling_W.astype(float)
+
+        # Outputs (accumulated in place)
+        elec = np.zeros(n)
+        gas = np.zeros(n)
+        out[Col.ELEC_WH.value] = elec
+        out[Col.GAS_WH.value] = gas
+        round_output = False
+
+        # detail columns (pre-created as NaN unless a phase fills them)
+        detail_cols = []
         if detail:
-            for c in [
+            detail_cols = [
                 # HR WWHP
                 Col.HR_HHW_W.value,
                 Col.HR_CHW_W.value,
@@ -171,8 +187,7 @@ def loads_to_site_energy(
                 Col.CHILLER_CHW_W.value,
                 Col.CHILLER_COP.value,
                 Col.ELEC_CHILLER_WH.value,
-            ]:
-                df[c] = np.nan
+            ]
 
         # ---- scenario ----
         scen = library.get_scenario(scenario_id)
@@ -211,8 +226,8 @@ def loads_to_site_energy(
 
             # Simultaneous load potential (using least-waste-heat factor)
             simult_h = np.minimum(
-                df[Col.HHW_REM_W.value].to_numpy(),
-                df[Col.CHW_REM_W.value].to_numpy()
+                hhw_rem,
+                chw_rem
                 / least_waste_heat[
                     "cap_h_to_cap_c"
                 ],  # amount of simultaneous load that the WWHP can actually satisfy
@@ -254,19 +269,19 @@ def loads_to_site_energy(
             )
 
             # Apply results
-            df[Col.MAX_CAP_H_HR_W.value] = max_cap_h  #! remove
-            df[Col.MIN_CAP_H_HR_W.value] = min_cap_h  #! remove
-            df[Col.SIMULT_H_HR_W.value] = simult_h  #! remove
-            df[Col.HR_HHW_W.value] = hr_hhw
-            df[Col.HR_CHW_W.value] = hr_chw
-            df[Col.HR_COP_H.value] = hr_cop_h
-            df[Col.ELEC_HR_WH.value] = elec_hr
-            df[Col.ELEC_WH.value] += elec_hr
-            df[Col.HHW_REM_W.value] -= hr_hhw
-            df[Col.CHW_REM_W.value] -= hr_chw
-            df[Col.HR_WWHP_REFRIGERANT.value] = hr_wwhp_refrigerant
-            df[Col.HR_WWHP_REFRIGERANT_WEIGHT_KG.value] = hr_wwhp_refrigerant_weight_kg
-            df[Col.HR_WWHP_REFRIGERANT_GWP.value] = hr_wwhp_refrigerant_gwp_kg
+            out[Col.MAX_CAP_H_HR_W.value] = max_cap_h  #! remove
+            out[Col.MIN_CAP_H_HR_W.value] = min_cap_h  #! remove
+            out[Col.SIMULT_H_HR_W.value] = simult_h  #! remove
+            out[Col.HR_HHW_W.value] = hr_hhw
+            out[Col.HR_CHW_W.value] = hr_chw
+            out[Col.HR_COP_H.value] = hr_cop_h
+            out[Col.ELEC_HR_WH.value] = elec_hr
+            elec += elec_hr
+            hhw_rem -= hr_hhw
+            chw_rem -= hr_chw
+            out[Col.HR_WWHP_REFRIGERANT.value] = hr_wwhp_refrigerant
+            out[Col.HR_WWHP_REFRIGERANT_WEIGHT_KG.value] = hr_wwhp_refrigerant_weight_kg
+            out[Col.HR_WWHP_REFRIGERANT_GWP.value] = hr_wwhp_refrigerant_gwp_kg
 
         # =========================
         # Phase 2 – AWHP Heating
@@ -293,11 +308,7 @@ def loads_to_site_energy(
             if awhp_h.performance and getattr(
                 awhp_h.performance_heating, "cap_curve", None
             ):
-                cap_ref = interp_vector(
-                    awhp_h.performance_heating.cap_curve.t_out_C,
-                    awhp_h.performance_heating.cap_curve.capacity_W,
-                    np.array([ref_temp_C]),
-                )[0]
+                cap_ref = awhp_h.performance_heating.cap_curve.get_capacity(ref_temp_C)
             elif getattr(awhp_h, "capacity_W", None):
                 cap_ref = float(awhp_h.capacity_W)
             else:
@@ -314,7 +325,7 @@ def loads_to_site_energy(
                     )
 
                 # Fraction of peak HHW load at reference temperature
-                peak_hhw_W = float(df["hhw_W"].max())
+                peak_hhw_W = float(heating_W.max())
                 target_load_W = peak_hhw_W * sizing_value
 
                 awhp_num_h = np.ceil(target_load_W / cap_ref)
@@ -337,7 +348,7 @@ def loads_to_site_energy(
             awhp_num_h = max(awhp_num_h, 0)
 
             cap_total_h_W = awhp_cap_h * awhp_num_h
-            served_h_W = np.minimum(df[Col.HHW_REM_W.value].to_numpy(), cap_total_h_W)
+            served_h_W = np.minimum(hhw_rem, cap_total_h_W)
             elec_h_Wh = served_h_W / awhp_cop_h
 
             # add refrigerant information
@@ -354,16 +365,16 @@ def loads_to_site_energy(
                 else 0.0
             )
 
-            df[Col.AWHP_HHW_W.value] = served_h_W
-            df[Col.AWHP_CAP_H_W.value] = cap_total_h_W
-            df[Col.AWHP_COP_H.value] = awhp_cop_h
-            df[Col.ELEC_AWHP_H_WH.value] = elec_h_Wh
-            df[Col.ELEC_WH.value] += elec_h_Wh
-            df[Col.HHW_REM_W.value] -= served_h_W
-            df[Col.AWHP_NUM_H.value] = float(awhp_num_h)
-            df[Col.AWHP_REFRIGERANT.value] = awhp_refrigerant
-            df[Col.AWHP_REFRIGERANT_WEIGHT_KG.value] = total_awhp_refrigerant_weight_kg
-            df[Col.AWHP_REFRIGERANT_GWP.value] = total_awhp_refrigerant_gwp_kg
+            out[Col.AWHP_HHW_W.value] = served_h_W
+            out[Col.AWHP_CAP_H_W.value] = cap_total_h_W
+            out[Col.AWHP_COP_H.value] = awhp_cop_h
+            out[Col.ELEC_AWHP_H_WH.value] = elec_h_Wh
+            elec += elec_h_Wh
+            hhw_rem -= served_h_W
+            out[Col.AWHP_NUM_H.value] = float(awhp_num_h)
+            out[Col.AWHP_REFRIGERANT.value] = awhp_refrigerant
+            out[Col.AWHP_REFRIGERANT_WEIGHT_KG.value] = total_awhp_refrigerant_weight_kg
+            out[Col.AWHP_REFRIGERANT_GWP.value] = total_awhp_refrigerant_gwp_kg
 
         # =========================
         # Phase 3 – Boiler (optional)
@@ -376,25 +387,25 @@ def loads_to_site_energy(
                     f"Boiler '{blr.eq_id}' requires a positive 'efficiency'."
                 )
 
-            boiler_served_W = df[Col.HHW_REM_W].to_numpy()
+            boiler_served_W = hhw_rem
             gas_Wh = boiler_served_W / eff
 
-            df[Col.BOILER_HHW_W.value] = boiler_served_W
-            df[Col.GAS_BOILER_WH.value] = gas_Wh
-            df[Col.BOILER_EFF.value] = eff
-            df[Col.GAS_WH.value] += gas_Wh
-            df[Col.HHW_REM_W.value] = 0.0
+            out[Col.BOILER_HHW_W.value] = boiler_served_W
+            out[Col.GAS_BOILER_WH.value] = gas_Wh
+            out[Col.BOILER_EFF.value] = eff
+            gas += gas_Wh
+            hhw_rem = np.zeros(n)
 
         # =========================
         # Phase 4 – Electric resistance (if heating remains)
         # =========================
-        remaining_h_W = df[Col.HHW_REM_W.value].to_numpy()
+        remaining_h_W = hhw_rem
         if np.any(remaining_h_W > 1e-9):
             elec_res_Wh = remaining_h_W  # COP = 1
-            df[Col.RES_HHW_W.value] = remaining_h_W
-            df[Col.ELEC_RES_WH.value] = elec_res_Wh
-            df[Col.ELEC_WH.value] += elec_res_Wh
-            df[Col.HHW_REM_W.value] = 0.0
+            out[Col.RES_HHW_W.value] = remaining_h_W
+            out[Col.ELEC_RES_WH.value] = elec_res_Wh
+            elec += elec_res_Wh
+            hhw_rem = np.zeros(n)
 
         # =========================
         # Phase 5 – AWHP Cooling
@@ -411,27 +422,27 @@ def loads_to_site_energy(
             cap_total_c_W = awhp_cap_c * awhp_num_c
 
             mask = (
-                df[Col.AWHP_HHW_W.value] == 0
+                out[Col.AWHP_HHW_W.value] == 0
             )  # create a mask for hours when no heating is served by AWHP
-            served_c_W = np.zeros(len(df))  # Initialize served_c_W as zeros
+            served_c_W = np.zeros(n)  # Initialize served_c_W as zeros
             served_c_W[mask] = np.minimum(
-                df.loc[mask, Col.CHW_REM_W.value].to_numpy(), cap_total_c_W[mask]
+                chw_rem[mask], cap_total_c_W[mask]
             )  # Compute only where mask is True
 
             # Compute electricity only where cooling is served
             elec_c_Wh = served_c_W / awhp_cop_c
-            df[Col.AWHP_CHW_W.value] = served_c_W
-            df[Col.AWHP_CAP_C_W.value] = cap_total_c_W
-            df[Col.AWHP_COP_C.value] = awhp_cop_c
-            df[Col.ELEC_AWHP_C_WH.value] = elec_c_Wh
-            df[Col.ELEC_WH.value] += elec_c_Wh
-            df[Col.CHW_REM_W.value] -= served_c_W
-            df[Col.AWHP_NUM_C] = float(awhp_num_c)
+            out[Col.AWHP_CHW_W.value] = served_c_W
+            out[Col.AWHP_CAP_C_W.value] = cap_total_c_W
+            out[Col.AWHP_COP_C.value] = awhp_cop_c
+            out[Col.ELEC_AWHP_C_WH.value] = elec_c_Wh
+            elec += elec_c_Wh
+            chw_rem -= served_c_W
+            out[Col.AWHP_NUM_C.value] = float(awhp_num_c)
 
         # =========================
         # Phase 6 – Electric chiller fallback
         # =========================
-        if df[Col.CHW_REM_W.value].sum() > 1e-9:
+        if np.any(chw_rem > 1e-9):
             chiller_cop = 5.0  # default <- why fix here?
             if scen.chiller:
                 chl = library.get_equipment(scen.chiller)
@@ -443,19 +454,18 @@ def loads_to_site_energy(
                     cop_curve = _per_unit_cooling_cop(chl, temps)  # could be array
                     if not np.isnan(cop_curve).all():
                         # if a curve exists, use the hourly values
-                        served_W = df[Col.CHW_REM_W.value].to_numpy()
+                        served_W = chw_rem
                         elec_Wh = served_W / cop_curve
-                        df[Col.CHILLER_CHW_W.value] = served_W
-                        df[Col.ELEC_CHILLER_WH.value] = elec_Wh
-                        df[Col.ELEC_WH.value] += elec_Wh
-                        df[Col.CHILLER_COP.value] = cop_curve
-                        df[Col.CHW_REM_W.value] = 0.0
+                        out[Col.CHILLER_CHW_W.value] = served_W
+                        out[Col.ELEC_CHILLER_WH.value] = elec_Wh
+                        elec += elec_Wh
+                        out[Col.CHILLER_COP.value] = cop_curve
+                        chw_rem = np.zeros(n)
                         # finalize and return
-                        cols = _finalize_columns(df, detail)
-                        return df[cols]
+                        return _assemble(out, detail_cols, index, detail)
 
             # scalar COP path
-            served_W = df[Col.CHW_REM_W.value].to_numpy()
+            served_W = chw_rem
             elec_Wh = served_W / chiller_cop
 
             # add refrigerant information
@@ -474,22 +484,23 @@ def loads_to_site_energy(
             )
 
             if detail:
-                df[Col.CHILLER_CHW_W.value] = served_W
-                df[Col.ELEC_CHILLER_WH.value] = elec_Wh
-                df[Col.CHILLER_COP.value] = chiller_cop
+                out[Col.CHILLER_CHW_W.value] = served_W
+                out[Col.ELEC_CHILLER_WH.value] = elec_Wh
+                out[Col.CHILLER_COP.value] = chiller_cop
 
-            df[Col.ELEC_WH.value] += elec_Wh
-            df[Col.CHW_REM_W.value] = 0.0
-            df[Col.CHILLER_REFRIGERANT.value] = chiller_refrigerant
-            df[Col.CHILLER_REFRIGERANT_WEIGHT_KG.value] = chiller_refrigerant_weight_kg
-            df[Col.CHILLER_REFRIGERANT_GWP.value] = chiller_refrigerant_gwp_kg
+            elec += elec_Wh
+            chw_rem = np.zeros(n)
+            out[Col.CHILLER_REFRIGERANT.value] = chiller_refrigerant
+            out[Col.CHILLER_REFRIGERANT_WEIGHT_KG.value] = chiller_refrigerant_weight_kg
+            out[Col.CHILLER_REFRIGERANT_GWP.value] = chiller_refrigerant_gwp_kg
 
-            df = df.round(4)
+            round_output = True
 
         # ---- finalize ----
-        cols = _finalize_columns(df, detail)
+        df = _assemble(out, detail_cols, index, detail)
+        if round_output:
+            df = df.round(4)
 
-        df = df[cols]
         df[Col.EQ_SCEN_ID.value] = scenario_id  # tag scenario
         df[Col.EQ_SCEN_NAME.value] = library.get_scenario(scenario_id).eq_scen_name
         results.append(df)
@@ -497,8 +508,19 @@ def loads_to_site_energy(
     return pd.concat(results, axis=0, ignore_index=False)
 
 
-def _finalize_columns(df: pd.DataFrame, detail: bool) -> list[str]:
-    """Return a clean column order for output."""
+def _assemble(
+    out: dict, detail_cols: list[str], index: pd.Index, detail: bool
+) -> pd.DataFrame:
+    """Build the hourly frame, in output column order, from the per-phase arrays."""
+    for c in detail_cols:
+        out.setdefault(c, np.nan)
+    # only the output columns are materialized, so no selection copy afterwards
+    cols = _finalize_columns(out, detail)
+    return pd.DataFrame({c: out[c] for c in cols}, index=index)
+
+
+def _finalize_columns(columns: Union[dict, pd.Index], detail: bool) -> list[str]:
+    """Return a clean column order for output (detail columns only if in `columns`)."""
     base = [
         Col.T_OUT_C.value,
         Col.HEATING_W.value,
@@ -548,10 +570,71 @@ def _finalize_columns(df: pd.DataFrame, detail: bool) -> list[str]:
         Col.CHILLER_REFRIGERANT_GWP.value,
     ]
     # only include those that actually exist
-    detail_cols = [c for c in detail_cols if c in df.columns]
+    detail_cols = [c for c in detail_cols if c in columns]
     return base + detail_cols
 
 
+@lru_cache(maxsize=64)
+def _month_hour_emissions(scenario_json: str) -> pd.DataFrame:
+    """
+    Month/hour averages of the hourly emission rates for one EmissionScenario,
+    one row per (month, hour) in order. The scenario is passed as JSON so it
+    can key the cache; the returned frame is shared and must not be modified.
+    """
+    em_scen = EmissionScenario.model_validate_json(scenario_json)
+    emissions_data = get_emissions_data(em_scen)
+
+    shortrun_weighting = float(em_scen.shortrun_weighting)
+    em = emissions_data.df
+
+    # all rates are in gCO2e/kWh
+    if em_scen.emission_type not in ("Combustion only", "Includes pre-combustion"):
+        raise ValueError(f"Invalid emissions_type: {em_scen.emission_type}")
+
+    lrmer = em[Col.LRMER_CO2E_C.value].to_numpy(dtype=float)
+    srmer = em[Col.SRMER_CO2E_C.value].to_numpy(dtype=float)
+    if em_scen.emission_type == "Includes pre-combustion":
+        lrmer = lrmer + em[Col.LRMER_CO2E_P.value].to_numpy(dtype=float)
+        srmer = srmer + em[Col.SRMER_CO2E_P.value].to_numpy(dtype=float)
+
+    rates = {
+        Col.ELEC_EMISSIONS_RATE_G_PER_KWH: lrmer * (1 - shortrun_weighting)
+        + srmer * shortrun_weighting,
+    }
+    for c in [
+        Col.LRMER_CO2E_C.value,
+        Col.LRMER_CO2E_P.value,
+        Col.LRMER_CO2E.value,
+        Col.SRMER_CO2E_C.value,
+        Col.SRMER_CO2E_P.value,
+        Col.SRMER_CO2E.value,
+    ]:
+        rates[c] = em[c].to_numpy(dtype=float)
+
+    # collapse emissions to month-hour averages: sum each rate into 288 bins
+    # with bincount and divide by the hour count (bins without hours are NaN)
+    group_cols = [Col.MONTH.value, Col.HOUR.value]
+    bins = (em.index.month.to_numpy() - 1) * 24 + em.index.hour.to_numpy()
+    counts = np.bincount(bins, minlength=288)
+    df_em = pd.DataFrame(
+        {
+            c: np.divide(
+                np.bincount(bins, weights=v, minlength=288),
+                counts,
+                out=np.full(288, np.nan),
+                where=counts > 0,
+            )
+            for c, v in rates.items()
+        },
+        index=pd.MultiIndex.from_product([range(1, 13), range(24)], names=group_cols),
+    )
+    df_em[Col.SHORTRUN_WEIGHTING.value] = np.where(
+        counts > 0, shortrun_weighting, np.nan
+    )
+
+    return df_em
+
+
 def site_to_source(
     df_loads: pd.DataFrame,
     metadata: Metadata,
@@ -562,126 +645,86 @@ def site_to_source(
     using StandardEmissions data and user EmissionsScenario settings.
     """
 
+    # calendar fields of the loads, shared by all emission scenarios
+    month = df_loads.index.month.to_numpy()
+    day = df_loads.index.day.to_numpy()
+    hour = df_loads.index.hour.to_numpy()
+    pos = (month - 1) * 24 + hour  # row of each hour in the month/hour averages
+    loads = df_loads.reset_index(drop=True)
+
+    # refrigerant emissions inventory (same for every emission scenario)
+    refrig_cols = [
+        Col.HR_WWHP_REFRIGERANT_GWP.value,
+        Col.AWHP_REFRIGERANT_GWP.value,
+        Col.CHILLER_REFRIGERANT_GWP.value,
+    ]
+
+    existing_refrig_cols = [c for c in refrig_cols if c in loads.columns]
+
+    if existing_refrig_cols:
+        # Compute the total refrigerant emissions inventory by summing available columns
+        total_refrig_gwp_kg = loads[existing_refrig_cols].sum(axis=1)
+    else:
+        # If none exist, default to zero
+        total_refrig_gwp_kg = 0.0
+
     results = []
 
     for em_scen_id in metadata.list_emission_scenarios():
 
-        emissions_data = get_emissions_data(metadata[em_scen_id])
-
         em_scen = metadata[em_scen_id]
 
-        shortrun_weighting = float(em_scen.shortrun_weighting)
         annual_refrig_leakage_percent = float(em_scen.annual_refrig_leakage_percent)
 
-        # extract month/hour from loads
-        base = df_loads.copy()
-        base[Col.MONTH.value] = base.index.month
-        base[Col.DAY.value] = base.index.day
-        base[Col.HOUR.value] = base.index.hour
-        base[Col.DOY.value] = base.index.dayofyear
-
-        # collapse emissions to month-hour averages
-        emissions_data.df[Col.MONTH.value] = emissions_data.df.index.month
-        emissions_data.df[Col.HOUR.value] = emissions_data.df.index.hour
-        emissions_data.df[Col.SHORTRUN_WEIGHTING.value] = shortrun_weighting
-        group_cols = [Col.MONTH.value, Col.HOUR.value]
-
-        # all rates are in gCO2e/kWh
-        if em_scen.emission_type == "Combustion only":
-            emissions_data.df[Col.ELEC_EMISSIONS_RATE_G_PER_KWH] = (
-                emissions_data.df[Col.LRMER_CO2E_C.value] * (1 - shortrun_weighting)
-            ) + (emissions_data.df[Col.SRMER_CO2E_C.value] * shortrun_weighting)
-        elif em_scen.emission_type == "Includes pre-combustion":
-            emissions_data.df[Col.ELEC_EMISSIONS_RATE_G_PER_KWH] = (
-                (
-                    emissions_data.df[Col.LRMER_CO2E_C.value]
-                    + emissions_data.df[Col.LRMER_CO2E_P.value]
-                )
-                * (1 - shortrun_weighting)
-            ) + (
-                (
-                    emissions_data.df[Col.SRMER_CO2E_C.value]
-                    + emissions_data.df[Col.SRMER_CO2E_P.value]
-                )
-                * shortrun_weighting
-            )
-        else:
-            raise ValueError(f"Invalid emissions_type: {em_scen.emission_type}")
-
-        df_em = (
-            emissions_data.df.groupby(group_cols)[
-                [
-                    Col.ELEC_EMISSIONS_RATE_G_PER_KWH,
-                    Col.LRMER_CO2E_C.value,
-                    Col.LRMER_CO2E_P.value,
-                    Col.LRMER_CO2E.value,
-                    Col.SRMER_CO2E_C.value,
-                    Col.SRMER_CO2E_P.value,
-                    Col.SRMER_CO2E.value,
-                    Col.SHORTRUN_WEIGHTING.value,
-                ]
-            ]
-            .mean()
-            .reset_index()
-        )
+        # month/hour averaged emission rates (cached per emission scenario)
+        df_em = _month_hour_emissions(em_scen.model_dump_json())
 
-        # expand loads with this year's emissions
-        merged = base.merge(df_em, on=[Col.MONTH.value, Col.HOUR.value], how="left")
-        merged[Col.YEAR.value] = em_scen.year
+        # expand loads with this year's emissions (rows of df_em are ordered by
+        # month/hour, so each hour's rates are a positional lookup, no join)
+        merged = pd.concat(
+            [loads, df_em.iloc[pos].reset_index(drop=True)],
+            axis=1,
+        )
 
         # electricity emissions
-        merged[Col.ELEC_EMISSIONS_KG_CO2E.value] = (
+        elec_emissions_kg = (
             merged[Col.ELEC_WH.value]
             * merged[Col.ELEC_EMISSIONS_RATE_G_PER_KWH.value]
-            / 1_000_000  #! make cleaner
+            * Wh_x_g_per_kWh_to_kg
         )
 
-        # gas emissions
+        # gas emissions (scalar factor folded once, one multiply per hour)
         if Col.GAS_WH.value in merged.columns:
-            merged[Col.GAS_EMISSIONS_KG_CO2E.value] = (
-                gas_emissions_rate * merged[Col.GAS_WH.value] / 1_000_000
+            gas_emissions_kg = merged[Col.GAS_WH.value] * (
+                gas_emissions_rate * Wh_x_g_per_kWh_to_kg
             )
         else:
-            merged[Col.GAS_EMISSIONS_KG_CO2E.value] = 0.0
+            gas_emissions_kg = 0.0
 
         # refrigerant emissions
-        refrig_cols = [
-            Col.HR_WWHP_REFRIGERANT_GWP.value,
-            Col.AWHP_REFRIGERANT_GWP.value,
-            Col.CHILLER_REFRIGERANT_GWP.value,
-        ]
-
-        existing_refrig_cols = [c for c in refrig_cols if c in merged.columns]
-
-        if existing_refrig_cols:
-            # Compute the total refrigerant emissions inventory by summing available columns
-            merged[Col.TOTAL_REFRIG_GWP_KG.value] = merged[existing_refrig_cols].sum(
-                axis=1
-            )
-        else:
-            # If none exist, default to zero
-            merged[Col.TOTAL_REFRIG_GWP_KG.value] = 0.0
-
-        merged[Col.TOTAL_REFRIG_EMISSIONS_KG_CO2E.value] = (
-            merged[Col.TOTAL_REFRIG_GWP_KG.value] * annual_refrig_leakage_percent
+        refrig_emissions_kg = total_refrig_gwp_kg * annual_refrig_leakage_percent
+
+        # add all derived columns at once instead of growing the frame per column
+        merged = merged.assign(
+            **{
+                Col.YEAR.value: em_scen.year,
+                Col.ELEC_EMISSIONS_KG_CO2E.value: elec_emissions_kg,
+                Col.GAS_EMISSIONS_KG_CO2E.value: gas_emissions_kg,
+                Col.TOTAL_REFRIG_GWP_KG.value: total_refrig_gwp_kg,
+                Col.TOTAL_REFRIG_EMISSIONS_KG_CO2E.value: refrig_emissions_kg,
+                Col.TOTAL_EMISSIONS_KG_CO2E.value: elec_emissions_kg
+                + gas_emissions_kg
+                + refrig_emissions_kg,
+                Col.EM_SCEN_ID.value: em_scen_id,  # tag scenario
+            }
         )
-
-        merged[Col.TIMESTAMP.value] = pd.to_datetime(
-            merged[[Col.YEAR.value, Col.MONTH.value, Col.DAY.value, Col.HOUR.value]]
+        merged.index = pd.DatetimeIndex(
+            pd.to_datetime(
+                {"year": em_scen.year, "month": month, "day": day, "hour": hour}
+            ),
+            name=Col.TIMESTAMP.value,
         )
 
-        merged = merged.drop(
-            columns=[Col.MONTH.value, Col.DAY.value, Col.DOY.value, Col.HOUR.value]
-        ).set_index(Col.TIMESTAMP.value)
-
-        merged[Col.TOTAL_EMISSIONS_KG_CO2E.value] = (
-            merged[Col.ELEC_EMISSIONS_KG_CO2E.value]
-            + merged[Col.GAS_EMISSIONS_KG_CO2E.value]
-            + merged[Col.TOTAL_REFRIG_EMISSIONS_KG_CO2E.value]
-        )
-
-        merged[Col.EM_SCEN_ID.value] = em_scen_id  # tag scenario
-
         results.append(merged)
 
     return pd.concat(results, axis=0, ignore_index=False)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 import pandas as pd
@@ -5,7 +6,8 @@ import numpy as np
 
 from src.metadata import Metadata
 
-STANDARD_COLUMNS = ["t_out_C", "heating_W", "cooling_W"]
+STANDARD_COLUMNS = ("t_out_C", "heating_W", "cooling_W")
+STANDARD_COLUMNS_SET = frozenset(STANDARD_COLUMNS)
 
 default_year = 2025  # for data without datetime info
 
@@ -53,9 +55,9 @@ class StandardLoad:
     def _validate(df: pd.DataFrame) -> pd.DataFrame:
 
         # Ensure required columns
-        missing = [c for c in STANDARD_COLUMNS if c not in df.columns]
+        missing = STANDARD_COLUMNS_SET.difference(df.columns)
         if missing:
-            raise ValueError(f"Missing required columns: {missing}")
+            raise ValueError(f"Missing required columns: {sorted(missing)}")
 
         # DATETIME VERSION
         # Timestamp / datetime handling
@@ -70,7 +72,7 @@ class StandardLoad:
             print(f"⚠️ Warning: inferred frequency = {freq}, expected hourly")
 
         # Enforce numeric columns
-        for col in ["t_out_C", "heating_W", "cooling_W"]:
+        for col in STANDARD_COLUMNS:
             df[col] = pd.to_numeric(df[col], errors="coerce")
             if df[col].isnull().any():
                 raise ValueError(f"Invalid numeric values in column {col}")
@@ -108,6 +110,36 @@ class StandardLoad:
         return self.df.describe()
 
 
+@lru_cache(maxsize=64)
+def _read_simulated_load(
+    ashrae_climate_zone: str,
+    building_type: str,
+    vintage: int,
+    path: Union[str, Path] = "data/input/load_data_simulated.parquet",
+) -> pd.DataFrame:
+    """
+    Read the simulated loads for one climate zone / building type / vintage.
+    Cached, so recalculating with an unchanged building does not re-read the
+    Parquet file. The returned frame is shared and must not be modified.
+    """
+    # Load the raw DataFrame
+    df = pd.read_parquet(path, engine="pyarrow")
+
+    # Filter by user metadata
+    mask = (
+        (df["ashrae_climate_zone"] == ashrae_climate_zone)
+        & (df["building_type"] == building_type)
+        & (df["vintage"] == vintage)
+    )
+
+    # Keep only canonical columns
+    df = df.loc[mask, ["timestamp", "t_out_C", "heating_W", "cooling_W"]]
+
+    # Timestamps are stored as "m/d/yy H:MM" strings; parse with the known
+    # format instead of letting pandas fall back to dateutil per element
+    return df.assign(timestamp=pd.to_datetime(df["timestamp"], format="%m/%d/%y %H:%M"))
+
+
 def get_load_data(settings: Metadata) -> StandardLoad:
     """
     Load and filter load data based on Metadata settings.
@@ -125,16 +157,9 @@ def get_load_data(settings: Metadata) -> StandardLoad:
         A validated, canonical load object ready for calculations.
     """
     if settings.load_type == "load_simulated":
-        # Load the raw DataFrame
-        df = pd.read_parquet("data/input/load_data_simulated.parquet", engine="pyarrow")
-
-        # Filter by user metadata
-        mask = (
-            (df["ashrae_climate_zone"] == settings.ashrae_climate_zone)
-            & (df["building_type"] == settings.building_type)
-            & (df["vintage"] == settings.vintage)
+        df = _read_simulated_load(
+            settings.ashrae_climate_zone, settings.building_type, settings.vintage
         )
-        df = df.loc[mask]
 
         if df.empty:
             raise ValueError(
@@ -142,11 +167,8 @@ def get_load_data(settings: Metadata) -> StandardLoad:
                 f"building type={settings.building_type}, vintage={settings.vintage}"
             )
 
-        # Keep only canonical columns
-        df = df[["timestamp", "t_out_C", "heating_W", "cooling_W"]]
-
-        # Wrap into StandardLoad (validation runs here)
-        return StandardLoad(df)
+        # Wrap into StandardLoad (validation runs here, on a copy of the cached frame)
+        return StandardLoad(df.copy())
         
     elif settings.load_type == "load_custom":
         if not settings.custom_load_path:
@@ -675,6 +675,12 @@ def plot_scatter_temp_vs_variable(
     col_to_type.update({col: "emissions" for col in emission_cols})
     col_to_type.update({col: "temperature" for col in temp_cols})
 
+    # --- Filter scenarios (copy, the input frame is left untouched) ---
+    df = df[
+        (df["eq_scen_id"].isin(equipment_scenarios))
+        & (df["em_scen_id"].isin(emission_scenarios))
+    ].copy()
+
     # --- Convert units if needed ---
     for col, var_type in col_to_type.items():
         if col in df.columns:
@@ -699,12 +705,6 @@ def plot_scatter_temp_vs_variable(
     y_hover_unit = get_hover_unit(y_var_type, unit_mode)
     t_hover_unit = get_hover_unit("temperature", unit_mode)
 
-    # --- Filter scenarios ---
-    df = df[
-        (df["eq_scen_id"].isin(equipment_scenarios))
-        & (df["em_scen_id"].isin(emission_scenarios))
-    ].copy()
-
     if not pd.api.types.is_datetime64_any_dtype(df.index):
         raise ValueError("DataFrame index must be datetime for daily averaging.")
 
@@ -725,12 +725,16 @@ def plot_scatter_temp_vs_variable(
 
     # --- Now group on columns only ---
     daily = df.groupby(
-        ["period", "eq_scen_id", "em_scen_id", "label"], as_index=False
+        ["period", "eq_scen_id", "em_scen_id", "label"],
+        as_index=False,
+        observed=True,
     ).agg({"t_out_C": "mean", y_var: "mean"})
 
     # --- Build figure ---
     fig = go.Figure()
-    for (scen_id, em_scen), df_s in daily.groupby(["eq_scen_id", "em_scen_id"]):
+    for (scen_id, em_scen), df_s in daily.groupby(
+        ["eq_scen_id", "em_scen_id"], observed=True
+    ):
         scen_name = df_s["label"].iloc[0]
         customdata = df_s[["label", "em_scen_id", "t_out_C", y_var]].values
         fig.add_trace(
@@ -1,6 +1,21 @@
 from dataclasses import dataclass
+from pathlib import Path
+import tempfile
+import numpy as np
 import pandas as pd
 
+LOCATIONS_CSV = Path("data/input/locations.csv")
+LOCATIONS_CACHE = Path("data/input/.locations_cache.parquet")
+
+# columns of locations.csv used by the app (zips is exploded into zip)
+LOCATIONS_DTYPES = {
+    "city": "category",
+    "state_id": "category",
+    "ASHRAE": "category",
+    "zips": "string",
+    "gea_grid_region": "category",
+}
+
 
 @dataclass
 class Location:
@@ -30,4 +45,50 @@ def get_city_and_zone(zip_code: str, df: pd.DataFrame) -> Location | None:
     )
 
 
+def load_locations(
+    csv_path: Path = LOCATIONS_CSV, cache_path: Path = LOCATIONS_CACHE
+) -> pd.DataFrame:
+    """Locations table with one row per zip code.
+
+    The exploded table is cached as Parquet next to the CSV and only rebuilt
+    when the CSV is newer than the cache.
+    """
+    csv_path, cache_path = Path(csv_path), Path(cache_path)
+    if cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            df = pd.read_parquet(cache_path, engine="pyarrow")
+        except Exception as e:  # unreadable cache, rebuild it from the CSV
+            print(f"⚠️ Warning: could not read locations cache {cache_path}: {e}")
+        else:
+            expected = (set(LOCATIONS_DTYPES) - {"zips"}) | {"zip"}
+            if set(df.columns) == expected:
+                return df
+
+    df = pd.read_csv(csv_path, usecols=list(LOCATIONS_DTYPES), dtype=LOCATIONS_DTYPES)
+
+    # Split space-separated zips into rows (repeat each row once per zip)
+    zips = df.pop("zips").fillna("").str.split().to_numpy()
+    lengths = np.fromiter(map(len, zips), dtype=np.intp, count=len(zips))
+    df = df.iloc[np.repeat(np.arange(len(df)), lengths)]
+    df["zip"] = pd.Categorical(np.concatenate(zips).astype(str))
+
+    # Write to a unique temporary file and rename it into place, so concurrent
+    # readers never see a partially written cache
+    partial_file = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=cache_path.stem, suffix=".tmp", delete=False
+        ) as f:
+            partial_file = Path(f.name)
+        df.to_parquet(partial_file, engine="pyarrow")
+        partial_file.replace(cache_path)
+    except OSError as e:  # e.g. read-only data folder, keep going without cache
+        print(f"⚠️ Warning: could not write locations cache {cache_path}: {e}")
+    finally:
+        if partial_file is not None:
+            partial_file.unlink(missing_ok=True)
+
+    return df
+
+
 # Data source: https://www.kaggle.com/datasets/bambroot/us-cities-and-ashre-climate-zone?resource=download
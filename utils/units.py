@@ -25,6 +25,7 @@ lps_to_cfm = 1 / cfm_to_lps
 ng_combustion_to_co2e = (
     1.29 * 5.3 * 1000 / 29.3
 )  # 5.3kg/therm to g/kWh (same unit as cambium emissions data, kg/MWh)
+Wh_x_g_per_kWh_to_kg = 1e-6  # energy [Wh] * emission rate [g/kWh] -> emissions [kg]
 
 
 ### CONVERSIONS ###